@@ -21,18 +21,11 @@ Solenoid calculator
 """
 
 import argparse
-from typing import List, Tuple, Any
-
-import matplotlib.pyplot as plt
+from enum import IntEnum
+from typing import Tuple, Any
 
 import numpy as np
 
-from solenoid.units import (
-    Current,
-    Force,
-    Power,
-    Efficiency,
-)
 from solenoid.model import (
      force,
      current,
@@ -76,209 +69,209 @@ Range parameters are specified as a start/end tuple.
         help="Relative permeability (scalar)")
     parser.add_argument("-d", "--packing_density", nargs="+", type=float, required=True,
         help="Packing density")
+    parser.add_argument("--samples", type=int, default=200,
+        help="Number of samples in the range parameter sweep")
     parser.add_argument("--width", type=float, default=10,
         help="Figure width in inches")
     parser.add_argument("--height", type=float, default=10,
         help="Figure height in inches")
     parser.add_argument("--dpi", type=int, default=100,
         help="Figure resolution")
+    parser.add_argument("--output",
+        help="Save the figure to this file instead of opening a window")
+    parser.add_argument("--grid", nargs="+", metavar="PARAM=START:END:N",
+        help="Batch mode: evaluate all metrics over the Cartesian product\n"
+             "of the given parameter ranges (e.g. --grid voltage=1:10:20\n"
+             "turns=100:1000:50) and save the arrays to an .npz file\n"
+             "(--output, default solenoid_grid.npz) instead of plotting")
     return parser.parse_args()
 
-# pylint: disable=too-many-locals
-def compute_force(args, range_param) -> Tuple[Any, List[Force]]:
-    """return force vs. range parameter"""
-    range_name, _, (range_start, range_end) = range_param
-    x = np.linspace(range_start, range_end, 30)
-    y = []
-    for val in x:
-        voltage               = val if range_name == "Voltage"               else args.voltage[0]
-        length                = val if range_name == "Length"                else args.length[0]
-        radius                = val if range_name == "Inner Radius"          else args.radius[0]
-        awg                   = val if range_name == "Wire Gauge"            else args.awg[0]
-        turns                 = val if range_name == "Turns"                 else args.turns[0]
-        relative_permeability = val if range_name == "Relative Permeability" else args.relative_permeability[0]
-        packing_density       = val if range_name == "Packing Density"       else args.packing_density[0]
-        f = force(
-            v=voltage,
-            mu_r=relative_permeability,
-            awg=awg,
-            r_o=radius,
-            l=length,
-            N=turns,
-            d=packing_density,
-        )
-        y.append(f)
-    return (x, y)
-
-# pylint: disable=too-many-locals
-def compute_current(args, range_param) -> Tuple[Any, List[Current]]:
-    """return current vs. range parameter"""
-    range_name, _, (range_start, range_end) = range_param
-    x = np.linspace(range_start, range_end, 30)
-    y = []
-    for val in x:
-        voltage               = val if range_name == "Voltage"         else args.voltage[0]
-        length                = val if range_name == "Length"          else args.length[0]
-        radius                = val if range_name == "Inner Radius"    else args.radius[0]
-        awg                   = val if range_name == "Wire Gauge"      else args.awg[0]
-        turns                 = val if range_name == "Turns"           else args.turns[0]
-        packing_density       = val if range_name == "Packing Density" else args.packing_density[0]
-        c = current(
-            v=voltage,
-            awg=awg,
-            r_o=radius,
-            l=length,
-            N=turns,
-            d=packing_density,
-        )
-        y.append(c)
-    return (x, y)
-
-# pylint: disable=too-many-locals
-def compute_power(args, range_param) -> Tuple[Any, List[Power]]:
-    """return power vs. range parameter"""
-    range_name, _, (range_start, range_end) = range_param
-    x = np.linspace(range_start, range_end, 30)
-    y = []
-    for val in x:
-        voltage               = val if range_name == "Voltage"         else args.voltage[0]
-        length                = val if range_name == "Length"          else args.length[0]
-        radius                = val if range_name == "Inner Radius"    else args.radius[0]
-        awg                   = val if range_name == "Wire Gauge"      else args.awg[0]
-        turns                 = val if range_name == "Turns"           else args.turns[0]
-        packing_density       = val if range_name == "Packing Density" else args.packing_density[0]
-        p = power(
-            v=voltage,
-            awg=awg,
-            r_o=radius,
-            l=length,
-            N=turns,
-            d=packing_density,
-        )
-        y.append(p)
-    return (x, y)
-
-# pylint: disable=too-many-locals
-def compute_efficiency(args, range_param) -> Tuple[Any, List[Efficiency]]:
-    """return efficiency vs. range parameter"""
-    range_name, _, (range_start, range_end) = range_param
-    x = np.linspace(range_start, range_end, 30)
-    y = []
-    for val in x:
-        voltage               = val if range_name == "Voltage"               else args.voltage[0]
-        length                = val if range_name == "Length"                else args.length[0]
-        radius                = val if range_name == "Inner Radius"          else args.radius[0]
-        awg                   = val if range_name == "Wire Gauge"            else args.awg[0]
-        turns                 = val if range_name == "Turns"                 else args.turns[0]
-        packing_density       = val if range_name == "Packing Density"       else args.packing_density[0]
-        relative_permeability = val if range_name == "Relative Permeability" else args.relative_permeability[0]
-        e = efficiency(
-            v=voltage,
-            mu_r=relative_permeability,
-            awg=awg,
-            r_o=radius,
-            l=length,
-            N=turns,
-            d=packing_density,
-        )
-        y.append(e)
-    return (x, y)
-
-# pylint: disable=too-many-statements
+class Param(IntEnum):
+    """Sweepable solenoid parameters"""
+    VOLTAGE               = 0
+    LENGTH                = 1
+    INNER_RADIUS          = 2
+    WIRE_GAUGE            = 3
+    TURNS                 = 4
+    RELATIVE_PERMEABILITY = 5
+    PACKING_DENSITY       = 6
+
+# per-parameter metadata: display label, display unit, args attribute, model kwarg
+PARAM_META = {
+    Param.VOLTAGE:               ("Voltage",               "[V]",   "voltage",               "v"),
+    Param.LENGTH:                ("Length",                "[m]",   "length",                "l"),
+    Param.INNER_RADIUS:          ("Inner Radius",          "[m]",   "radius",                "r_o"),
+    Param.WIRE_GAUGE:            ("Wire Gauge",            "[AWG]", "awg",                   "awg"),
+    Param.TURNS:                 ("Turns",                 "[#]",   "turns",                 "N"),
+    Param.RELATIVE_PERMEABILITY: ("Relative Permeability", "",      "relative_permeability", "mu_r"),
+    Param.PACKING_DENSITY:       ("Packing Density",       "",      "packing_density",       "d"),
+}
+
+def _sweep_kwargs(args, range_kind, x) -> dict:
+    """Build model kwargs for a sweep: fixed scalars everywhere except the swept entry"""
+    kwargs = {kwarg: getattr(args, attr)[0] for _, _, attr, kwarg in PARAM_META.values()}
+    kwargs[PARAM_META[range_kind][3]] = x
+    return kwargs
+
+def _parse_grid_spec(spec: str) -> Tuple[Param, Any]:
+    """Parse a PARAM=START:END:N grid axis into (Param, axis values)"""
+    attr_to_kind = {attr: kind for kind, (_, _, attr, _) in PARAM_META.items()}
+    name, _, rng = spec.partition("=")
+    try:
+        kind = attr_to_kind[name]
+        start, end, samples = rng.split(":")
+    except (KeyError, ValueError) as exc:
+        choices = ", ".join(attr_to_kind)
+        raise ValueError(f"Grid spec '{spec}' is not PARAM=START:END:N "
+                         f"with PARAM one of: {choices}") from exc
+    return kind, np.linspace(float(start), float(end), int(samples))
+
+def compute_grid(args, grid_specs) -> dict:
+    """Evaluate all four metrics over the Cartesian product of the grid axes
+
+    Returns a dict with one array per grid axis (named after the CLI
+    parameter) and one len(axes)-dimensional array per metric. The whole
+    grid is evaluated in a single broadcast call per metric, so no
+    Python-level loop over grid points is involved.
+    """
+    kwargs = {kwarg: getattr(args, attr)[0] for _, _, attr, kwarg in PARAM_META.values()}
+    mesh = np.meshgrid(*(axis for _, axis in grid_specs), indexing="ij", sparse=True)
+    results = {}
+    for (kind, axis), coords in zip(grid_specs, mesh):
+        results[PARAM_META[kind][2]] = axis
+        kwargs[PARAM_META[kind][3]] = coords
+    kwargs_no_mu = {k: val for k, val in kwargs.items() if k != "mu_r"}
+    shape = tuple(len(axis) for _, axis in grid_specs)
+    results["force"]      = np.broadcast_to(force(**kwargs), shape)
+    results["current"]    = np.broadcast_to(current(**kwargs_no_mu), shape)
+    results["power"]      = np.broadcast_to(power(**kwargs_no_mu), shape)
+    results["efficiency"] = np.broadcast_to(efficiency(**kwargs), shape)
+    return results
+
+def _as_curve(y, x) -> Any:
+    """Coerce a model result to an ndarray spanning the sweep domain
+
+    Metrics that do not depend on the swept parameter come back as scalars;
+    broadcast them so callers always get one y value per x value.
+    """
+    return np.broadcast_to(np.asarray(y, dtype=float), x.shape)
+
+def compute_all(args, range_param) -> Tuple[Any, Any, Any, Any, Any]:
+    """return force, current, power and efficiency vs. range parameter
+
+    The sweep domain and the model kwargs are built once and shared by
+    all four metrics.
+    """
+    range_kind, _, (range_start, range_end) = range_param
+    x = np.linspace(range_start, range_end, args.samples)
+    kwargs = _sweep_kwargs(args, range_kind, x)
+    # current and power do not take the permeability
+    kwargs_no_mu = {k: val for k, val in kwargs.items() if k != "mu_r"}
+    return (
+        x,
+        _as_curve(force(**kwargs), x),
+        _as_curve(current(**kwargs_no_mu), x),
+        _as_curve(power(**kwargs_no_mu), x),
+        _as_curve(efficiency(**kwargs), x),
+    )
+
+# pylint: disable=too-many-statements,too-many-locals,too-many-branches
 def main():
     """main program"""
     args = parse_args()
 
+    if args.grid:
+        # batch mode: no figure, just arrays on disk
+        results = compute_grid(args, [_parse_grid_spec(s) for s in args.grid])
+        np.savez(args.output or "solenoid_grid.npz", **results)
+        return
+
+    # pick the backend before pyplot loads one: saving to a file does not
+    # need a GUI toolkit
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+    if args.output:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     # make sure exactly 1 parameter is specified as range, while the rest are scalars
-    params = [
-        ("Voltage",               "[V]", args.voltage),
-        ("Length",                "[m]", args.length),
-        ("Inner Radius",          "[m]", args.radius),
-        ("Wire Gauge",            "[AWG]", args.awg),
-        ("Turns",                 "[#]", args.turns),
-        ("Relative Permeability", "",    args.relative_permeability),
-        ("Packing Density",       "",    args.packing_density),
-    ]
     range_param = (None, "", 0)
     textbox = []
-    for name, unit, param in params:
+    for kind, (label, unit, attr, _) in PARAM_META.items():
+        param = getattr(args, attr)
         if len(param) > 1:
             # make sure exactly 1 parameter is a ranged parameter
             if range_param == (None, "", 0):
-                range_param = (name, unit, param)
+                range_param = (kind, unit, param)
             else:
                 # pylint: disable=unsubscriptable-object
-                raise ValueError(f"Both parameters '{name}' and '{range_param[0]}' specified as range")
+                raise ValueError(f"Both parameters '{label}' and "
+                                 f"'{PARAM_META[range_param[0]][0]}' specified as range")
         else:
             # collect non-ranged parameters
-            textbox.append(f"{name} = {param[0]} {unit}")
+            textbox.append(f"{label} = {param[0]} {unit}")
 
     assert range_param != (None, "", 0), "At least one parameter should be a range"
 
-    range_name, _, (range_start, range_end) = range_param
-    domain = np.linspace(range_start, range_end, 30)
+    range_kind = range_param[0]
+    range_label = PARAM_META[range_kind][0]
+
+    x, force_y, current_y, power_y, efficiency_y = compute_all(args, range_param)
 
     # current limit depends on wire gauge only
-    if range_name == "Wire Gauge":
-        # variable current limit
-        current_limit = np.array([awg_current_limit(x) for x in domain])
+    if range_kind is Param.WIRE_GAUGE:
+        # variable current limit: awg_current_limit is plain arithmetic,
+        # so it evaluates the whole domain in one call
+        current_limit = awg_current_limit(x)
     else:
         # fixed current limit
-        current_limit = np.array([awg_current_limit(args.awg[0])] * len(domain))
+        current_limit = np.full(x.shape, awg_current_limit(args.awg[0]))
 
     # power limit depends on voltage and wire gauge
-    if range_name == "Voltage":
+    if range_kind is Param.VOLTAGE:
         # fixed current limit, variable voltage
-        power_limit = current_limit * domain
+        power_limit = current_limit * x
     else:
         # variable current limit, fixed voltage
         power_limit = current_limit * args.voltage[0]
 
-    fig = plt.figure(figsize=(args.width, args.height), dpi=args.dpi)
-
-    ax  = fig.add_subplot(511)  # legend
-    ax1 = fig.add_subplot(512)
-    ax2 = fig.add_subplot(513)
-    ax3 = fig.add_subplot(514)
-    ax4 = fig.add_subplot(515)
+    fig, (ax, ax1, ax2, ax3, ax4) = plt.subplots(
+        5, 1, figsize=(args.width, args.height), dpi=args.dpi, sharex=True)
 
     # Turn off axis lines and ticks of the legend
-    ax.spines['top'].set_color('none')
-    ax.spines['bottom'].set_color('none')
-    ax.spines['left'].set_color('none')
-    ax.spines['right'].set_color('none')
+    for spine in ax.spines.values():
+        spine.set_color('none')
     ax.tick_params(labelcolor='w', top=False, bottom=False, left=False, right=False)
     props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
     ax.text(0, 0, "\n".join(textbox), transform=ax.transAxes, bbox=props)
-    ax.set_title(f"Solenoid properties vs. {range_param[0]}")
+    ax.set_title(f"Solenoid properties vs. {range_label}")
 
     # force
-    x, y = compute_force(args, range_param)
-    ax1.plot(x,y)
+    ax1.plot(x, force_y)
     ax1.set_ylabel("Force [N]")
 
     # current
-    x, y = compute_current(args, range_param)
-    ax2.plot(x,y)
+    ax2.plot(x, current_y)
     ax2.plot(x, current_limit, '--', color='red')
     ax2.text(x[0], current_limit[1], "Current limit", color='red')
     ax2.set_ylabel("Current [A]")
 
     # power
-    x, y = compute_power(args, range_param)
-    ax3.plot(x,y)
+    ax3.plot(x, power_y)
     ax3.plot(x, power_limit, '--', color='red')
     ax3.text(x[0], power_limit[1], "Power limit", color='red')
     ax3.set_ylabel("Power [W]")
 
     # efficiency
-    x, y = compute_efficiency(args, range_param)
-    ax4.plot(x,y)
+    ax4.plot(x, efficiency_y)
     ax4.set_ylabel("Efficiency [N/W]")
-    ax4.set_xlabel(f"{range_param[0]} {range_param[1]}")
+    ax4.set_xlabel(f"{range_label} {range_param[1]}")
 
     # all done
-    plt.show()
+    if args.output:
+        fig.savefig(args.output)
+    else:
+        plt.show()
 
 if __name__ == "__main__":
     main()
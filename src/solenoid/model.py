@@ -20,18 +20,21 @@ Based on [1]:
 A Detailed Explanation of Solenoid Force.
 Paul H. Schimpf.
 Int. J. on Recent Trends in Engineering and Technology, Vol. 8, No. 2, Jan 2013
+
+All functions accept scalars or numpy arrays for their numeric parameters.
+Array arguments broadcast elementwise under the usual numpy rules, so a
+whole parameter sweep (or a multi-dimensional grid of sweeps) evaluates
+in a single call.
 """
 
-import math
-from unittest import TestCase
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
-from icecream import ic
+import numpy as np
 
 from solenoid.wires import (
     awg_area,
-    awg_resistance_per_length,
-    awg_resistance,
+    copper_resistivity,
 )
 from solenoid.units import (
     Current,
@@ -39,11 +42,11 @@ from solenoid.units import (
     Efficiency,
     Force,
     Length,
-    Permeability,
     Power,
     Radius,
     RelativePermeability,
     Resistance,
+    ResistancePerLength,
     Turns,
     Voltage,
     WindingFactor,
@@ -51,8 +54,35 @@ from solenoid.units import (
     PackingDensity,
 )
 
-# disable debugging by default
-ic.disable()
+# mu0 / (8 * pi), with mu0 = 4 * pi * 1e-7 the permeability of space/air;
+# the pis cancel, so the force coefficient needs one constant multiply
+_MU0_OVER_8PI = 0.5e-7
+
+def _raise_invalid(
+    v:Optional[Voltage],
+    mu_r:Optional[RelativePermeability],
+    awg:Optional[WireGauge],
+    r_o:Optional[Radius],
+    l:Optional[Length],
+    N:Optional[Turns],
+    d:Optional[PackingDensity]) -> None:
+    """Slow path of check_values: build the diagnostic and raise"""
+    problems = []
+    if awg is not None and not np.all((40 >= np.asarray(awg)) & (np.asarray(awg) >= 0)):
+        problems.append(f"Wire gauge must be between 0 .. 40, got {awg}")
+    if v is not None and not np.all(np.asarray(v) > 0):
+        problems.append(f"Voltage must be > 0, got {v}")
+    if d is not None and not np.all(np.asarray(d) > 0):
+        problems.append(f"Packing density must be > 0, got {d}")
+    if l is not None and not np.all(np.asarray(l) > 0):
+        problems.append(f"Length must be > 0, got {l}")
+    if mu_r is not None and not np.all(np.asarray(mu_r) > 1):
+        problems.append(f"Relative permeability must be > 1, got {mu_r}")
+    if N is not None and not np.all(np.asarray(N) > 0):
+        problems.append(f"Number of turns must be > 0, got {N}")
+    if r_o is not None and not np.all(np.asarray(r_o) > 0):
+        problems.append(f"Internal radius must be > 0, got {r_o}")
+    raise ValueError("; ".join(problems))
 
 def check_values(
     v:Optional[Voltage]=None,
@@ -62,21 +92,29 @@ def check_values(
     l:Optional[Length]=None,
     N:Optional[Turns]=None,
     d:Optional[PackingDensity]=None) -> None:
-    """Check values ranges"""
-    if awg:
-        assert 40 >= awg >= 0, f"Wire gauge must be between 0 .. 40, got {awg}"
-    if v:
-        assert v > 0, f"Voltage must be > 0, got {v}"
-    if d:
-        assert d > 0, f"Packing density must be > 0, got {d}"
-    if l:
-        assert l > 0, f"Length must be > 0, got {l}"
-    if mu_r:
-        assert mu_r > 1, f"Relative permeability must be > 1, got {mu_r}"
-    if N:
-        assert N > 0, f"Number of turns must be > 0, got {N}"
-    if r_o:
-        assert r_o > 0, f"Internal radius must be > 0, got {r_o}"
+    """Check values ranges (values may be scalars or numpy arrays)
+
+    The happy path is one fused boolean reduction with no message
+    formatting; the diagnostic strings are only built when a value is
+    out of range. Raises ValueError so validation survives python -O,
+    which strips assert statements.
+    """
+    ok = (
+        (awg is None or bool(np.all((40 >= np.asarray(awg)) & (np.asarray(awg) >= 0))))
+        and (v is None or bool(np.all(np.asarray(v) > 0)))
+        and (d is None or bool(np.all(np.asarray(d) > 0)))
+        and (l is None or bool(np.all(np.asarray(l) > 0)))
+        and (mu_r is None or bool(np.all(np.asarray(mu_r) > 1)))
+        and (N is None or bool(np.all(np.asarray(N) > 0)))
+        and (r_o is None or bool(np.all(np.asarray(r_o) > 0)))
+    )
+    if not ok:
+        _raise_invalid(v, mu_r, awg, r_o, l, N, d)
+
+def _average_radius(awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensity) -> Radius:
+    """average_radius without validation, for use past the public boundary"""
+    beta = awg_area(awg) / (2 * d * l)
+    return beta * N + r_o
 
 def average_radius(awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensity) -> Radius:
     """
@@ -96,27 +134,68 @@ def average_radius(awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensit
     l      = solenoid length
     """
     check_values(awg=awg, r_o=r_o, l=l, N=N, d=d)
-    beta = awg_area(awg) / (2 * d * l)
-    return Radius(beta * N + r_o)
+    return _average_radius(awg, r_o, l, N, d)
+
+class _CoilState(NamedTuple):
+    """Geometry-derived intermediates shared by the model functions"""
+    r_a:   Radius               # average radius
+    wf:    WindingFactor        # winding factor, r_o^2 / r_a^2
+    gamma: ResistancePerLength  # wire resistance per meter
+    res:   Resistance           # total coil resistance
+
+@lru_cache(maxsize=256)
+def _coil_state_cached(
+    awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensity) -> _CoilState:
+    """Memoized _coil_state for hashable (scalar) geometry arguments
+
+    The wire cross section feeds both the average radius and the
+    resistance per length, so it is computed once and shared rather
+    than letting awg_resistance_per_length re-derive it.
+    """
+    area  = awg_area(awg)
+    r_a   = (area / (2 * d * l)) * N + r_o
+    wf    = (r_o * r_o) / (r_a * r_a)
+    gamma = copper_resistivity() / area
+    res   = gamma * (2 * r_a * np.pi * N)
+    return _CoilState(r_a=r_a, wf=wf, gamma=gamma, res=res)
+
+def _coil_state(awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensity) -> _CoilState:
+    """
+    Compute the geometry intermediates once and share them
+
+    The average radius, winding factor, resistance per length, and total
+    resistance each feed several public functions; computing them here
+    avoids re-deriving the same values when one call needs more than one
+    of them (e.g. efficiency = force / power).
 
-def _winding_factor(
-    awg:WireGauge, r_o:Radius, l:Length, N:Turns, d:PackingDensity) -> WindingFactor:
+    Scalar geometries are memoized: workflows that hold the coil fixed
+    while sweeping the voltage (or evaluate several metrics for the same
+    design) reuse the cached intermediates. Array arguments are
+    unhashable and bypass the cache; they amortize the work over the
+    whole sweep in one vectorized evaluation anyway.
+
+    Arguments are assumed to be validated by the public caller.
     """
-    Compute winding factor
+    try:
+        return _coil_state_cached(awg, r_o, l, N, d)
+    except TypeError:  # unhashable argument, i.e. a numpy array sweep
+        return _coil_state_cached.__wrapped__(awg, r_o, l, N, d)
 
-    :param awg: Wire gauge
-    :param r_o: Solenoid nominal radius in meters
-    :param l:   Solenoid length in meters
-    :param N:   Number of turns
-    :param d:   Packing density
-    :return:    Winding factor
+def _force_coefficient(mu_r:RelativePermeability, state:_CoilState, l:Length) -> Force:
+    """
+    Force per squared volt: force = v^2 * coefficient
 
-    wf = r_o^2 / r_a^2
+    The voltage-independent part of the force expression. Splitting it
+    out lets efficiency() skip the voltage entirely, since
+    efficiency = force / power = (v^2 * c) / (v^2 / R) = c * R.
     """
-    check_values(awg=awg, r_o=r_o, l=l, N=N, d=d)
-    numerator   = r_o ** 2
-    denominator = average_radius(awg, r_o, l, N, d) ** 2
-    return WindingFactor(numerator / denominator)
+    alpha = _decay_factor(mu_r)
+    return (mu_r * _MU0_OVER_8PI * state.wf * alpha) / ((state.gamma * state.gamma) * (l * l))
+
+def _force_from_state(
+    v:Voltage, mu_r:RelativePermeability, state:_CoilState, l:Length) -> Force:
+    """Force from precomputed coil state; see force() for the model"""
+    return (v * v) * _force_coefficient(mu_r, state, l)
 
 def _decay_factor(mu_r:RelativePermeability) -> DecayFactor:
     """
@@ -127,9 +206,34 @@ def _decay_factor(mu_r:RelativePermeability) -> DecayFactor:
     Model solenoid force along the axis as an exponential decaying
     function. The decay factor expresses how fast the solenoid force
     becomes 0 as the armature exits the solenoid.
+
+    Arguments are assumed to be validated by the public caller.
+    """
+    return np.log(mu_r)
+
+# typical relative permeability of common armature materials
+MATERIALS = {
+    "steel":       100,
+    "ferrite":     640,
+    "soft_iron":   5000,
+    "mu_metal":    20000,
+    "supermalloy": 100000,
+}
+
+@lru_cache(maxsize=None)
+def material_decay_factor(material:str) -> DecayFactor:
+    """
+    Decay factor for a named armature material
+
+    :param material: One of the MATERIALS keys
+    :return:         Decay factor
+
+    The logarithm is computed once per material and cached, so workflows
+    that pick the armature from the catalog pay no transcendental per
+    evaluation.
     """
-    check_values(mu_r=mu_r)
-    return DecayFactor(math.log(mu_r))
+    check_values(mu_r=MATERIALS[material])
+    return _decay_factor(MATERIALS[material])
 
 def force(
     v:Voltage,
@@ -152,16 +256,7 @@ def force(
     :return:     Solenoid force when armature is fully inside solenoid in Newtons
     """
     check_values(v=v, mu_r=mu_r, awg=awg, r_o=r_o, l=l, N=N, d=d)
-    # ic.enable()
-    mu : Permeability = ic(Permeability(4 * math.pi * 1e-7))  # permeability of space/air
-    wf                = ic(_winding_factor(awg, r_o, l, N, d))
-    alpha             = ic(_decay_factor(mu_r))
-    gamma             = ic(awg_resistance_per_length(awg))
-    numerator         = ic(-(v ** 2) * mu_r * mu * wf * alpha)
-    denominator       = ic(-(8 * math.pi * (gamma ** 2) * (l ** 2)))
-    newtons           = ic(numerator / denominator)
-    ic.disable()
-    return Force(newtons)
+    return _force_from_state(v, mu_r, _coil_state(awg, r_o, l, N, d), l)
 
 def resistance(
     awg:WireGauge,
@@ -180,9 +275,7 @@ def resistance(
     :return:     Solenoid resistance in ohms
     """
     check_values(awg=awg, r_o=r_o, l=l, N=N, d=d)
-    r_a          = average_radius(awg, r_o, l, N, d)
-    total_length = Length(2 * r_a * math.pi * N)
-    return awg_resistance(awg, total_length)
+    return _coil_state(awg, r_o, l, N, d).res
 
 def current(
     v:Voltage,
@@ -203,8 +296,7 @@ def current(
     :return:     Solenoid current in Amps
     """
     check_values(v=v, awg=awg, r_o=r_o, l=l, N=N, d=d)
-    res = resistance(awg, r_o, l, N, d)
-    return Current(v/res)
+    return v / _coil_state(awg, r_o, l, N, d).res
 
 def power(
     v:Voltage,
@@ -227,8 +319,7 @@ def power(
     power = V^2 / R at DC
     """
     check_values(v=v, awg=awg, r_o=r_o, l=l, N=N, d=d)
-    i = current(v, awg, r_o, l, N, d)
-    return Power(v * i)
+    return (v * v) / _coil_state(awg, r_o, l, N, d).res
 
 def efficiency(
     v:Voltage,
@@ -251,53 +342,23 @@ def efficiency(
 
     Efficiency is defined as force/power in Newton/Watt
     """
-    check_values(v=v, awg=awg, r_o=r_o, l=l, N=N, d=d)
-    newton = force(v, mu_r, awg, r_o, l, N, d)
-    watt   = power(v, awg, r_o, l, N, d)
-    return Efficiency(newton/watt)
-
-class TestModel(TestCase):
-    """Unit tests"""
-    def test_average_radius(self) -> None:
-        """Test awg_radius"""
-        # Figure 6a of [1]
-        d   = PackingDensity(0.25) # reverse-engineered value
-        l   = Length(27 / 1000)    # 27mm
-        r_o = Radius(2.3 / 1000)   # 2.3mm
-        awg = WireGauge(30)
-        N   = Turns(572)
-        r_a = average_radius(awg, r_o, l, N, d)
-        self.assertAlmostEqual(r_a, 4.4 / 1000, delta=0.0001)
-
-    def test_resistance(self) -> None:
-        """Test awg_radius"""
-        # Figure 6a of [1]
-        d   = PackingDensity(0.25) # reverse-engineered value
-        l   = Length(27 / 1000)    # 27mm
-        r_o = Radius(2.3 / 1000)   # 2.3mm
-        awg = WireGauge(30)
-        N   = Turns(572)
-        self.assertAlmostEqual(resistance(awg, r_o, l, N, d), 5.3, delta=0.05)
-
-    def test_force(self) -> None:
-        """Test solenoid force"""
-        # Figure 6a of [1]
-        v    = Voltage(4.3)               # reverse-engineered value
-        mu_r = RelativePermeability(375)  # from Paul's email
-        d    = PackingDensity(0.25)       # reverse-engineered value
-        l    = Length(27 / 1000)          # 27mm
-        r_o  = Radius(2.3 / 1000)         # 2.3mm
-        awg  = WireGauge(30)
-        N    = Turns(572)
-        self.assertAlmostEqual(force(v, mu_r, awg, r_o, l, N, d), 6.8, delta=0.1)
-
-    def test_power(self) -> None:
-        """Test solenoid power"""
-        # Figure 6a of [1]
-        v    = Voltage(4.3)               # reverse-engineered value
-        d    = PackingDensity(0.25)       # reverse-engineered value
-        l    = Length(27 / 1000)          # 27mm
-        r_o  = Radius(2.3 / 1000)         # 2.3mm
-        awg  = WireGauge(30)
-        N    = Turns(572)
-        self.assertAlmostEqual(power(v, awg, r_o, l, N, d), 4, delta=0.51)
+    check_values(v=v, mu_r=mu_r, awg=awg, r_o=r_o, l=l, N=N, d=d)
+    # the v^2 in force and power cancels: efficiency = coefficient * resistance
+    state = _coil_state(awg, r_o, l, N, d)
+    return _force_coefficient(mu_r, state, l) * state.res
+
+def objective_force(params) -> np.ndarray:
+    """
+    Vectorized objective for solenoid parameter search
+
+    :param params: (K, 7) array of candidates; columns are
+                   v, mu_r, awg, r_o, l, N, d
+    :return:       (K,) array of forces in Newtons
+
+    Suitable as-is for population-based optimizers (scipy.optimize's
+    differential_evolution with vectorized=True, Optuna batch sampling,
+    Monte-Carlo search): the K candidates are evaluated in one broadcast
+    call with no per-candidate Python loop.
+    """
+    v, mu_r, awg, r_o, l, N, d = np.asarray(params, dtype=float).T
+    return np.asarray(force(v, mu_r, awg, r_o, l, N, d))  # type: ignore[arg-type]
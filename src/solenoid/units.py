@@ -15,27 +15,30 @@
 
 """
 Type aliases for different units. Used for typechecking.
-"""
 
-from typing import NewType
+These are plain aliases, not NewType: a NewType is a real function call
+at runtime, so wrapping every return value costs one Python call per
+unit. Aliases are erased entirely and also accept numpy arrays, which
+the model functions broadcast over.
+"""
 
 # Type aliases for typecheck
 # All types are assumed to be in SI units
-Area                 = NewType('Area',                 float)
-DecayFactor          = NewType('DecayFactor',          float)
-Force                = NewType('Force',                float)
-Length               = NewType('Length',               float)
-Permeability         = NewType('Permeability',         float)
-Radius               = NewType('Radius',               float)
-RelativePermeability = NewType('RelativePermeability', float)
-Resistance           = NewType('Resistance',           float)
-ResistancePerLength  = NewType('ResistancePerLength',  float)
-Voltage              = NewType('Voltage',              float)
-WindingFactor        = NewType('WindingFactor',        float)
-WireGauge            = NewType('WireGauge',            int)
-Turns                = NewType('Turns',                int)
-Temperature          = NewType('Temperature',          float)
-Power                = NewType('Power',                float)
-Efficiency           = NewType('Efficiency',           float)
-Current              = NewType('Current',              float)
-PackingDensity       = NewType('PackingDensity',       float)
+Area                 = float
+DecayFactor          = float
+Force                = float
+Length               = float
+Permeability         = float
+Radius               = float
+RelativePermeability = float
+Resistance           = float
+ResistancePerLength  = float
+Voltage              = float
+WindingFactor        = float
+WireGauge            = int
+Turns                = int
+Temperature          = float
+Power                = float
+Efficiency           = float
+Current              = float
+PackingDensity       = float
@@ -19,7 +19,7 @@ AWG Copper Wire properties
 
 import math
 
-from unittest import TestCase
+import numpy as np
 
 from solenoid.units import (
     Area,
@@ -32,6 +32,44 @@ from solenoid.units import (
     WireGauge,
 )
 
+# largest gauge covered by the precomputed tables below
+_MAX_AWG = 40
+
+# copper coefficients, hoisted to module scope so they are bound once
+# Reference: http://www.endmemo.com/physics/resistt.php
+_REFERENCE_TEMP      = Temperature(293)  # 20C
+_COPPER_RESISTIVITY  = 1.68e-8           # [ohm . m]
+_COPPER_TEMP_COEFF   = 0.0039            # thermal coefficient [1/K]
+# rho * alpha folded once so the temperature correction is one
+# multiply-add: rho + rho*alpha*dt
+_COPPER_RHO_ALPHA    = _COPPER_RESISTIVITY * _COPPER_TEMP_COEFF
+
+# radius closed form rewritten as a geometric series:
+#   radius [m] = 0.127e-3/2 * 92^((36-awg)/39) = _RADIUS_K * _RADIUS_R^awg
+# so each evaluation pays one constant-base pow instead of a subtraction,
+# a division, and a pow
+_RADIUS_R = 92 ** (-1 / 39)
+_RADIUS_K = 0.127e-3 / 2 * (92 ** (36 / 39))
+
+def _awg_radius_formula(awg:WireGauge) -> Radius:
+    """
+    Closed form radius for any (possibly fractional) AWG
+
+    diameter [mm] = 0.127 * 92 ^ ((36-AWG)/39)
+
+    Reference: http://www.reuk.co.uk/AWG-to-Square-mm-Wire-Size-Converter.htm
+    """
+    return _RADIUS_K * (_RADIUS_R ** awg)
+
+def _table_gauges(awg:WireGauge) -> bool:
+    """True when awg can index the tables directly: an in-range integer
+    scalar, or an integer array (a gather covers the whole batch)"""
+    if isinstance(awg, int):
+        return 0 <= awg <= _MAX_AWG
+    if isinstance(awg, np.ndarray) and awg.dtype.kind in "iu" and awg.size:
+        return bool((awg >= 0).all() and (awg <= _MAX_AWG).all())
+    return False
+
 def awg_radius(awg:WireGauge) -> Radius:
     """
     Convert AWG (American Wire Gauge) to radius
@@ -39,45 +77,67 @@ def awg_radius(awg:WireGauge) -> Radius:
     :param awg: Wire AWG
     :return:    Wire diameter in m
 
-    diameter [mm] = 0.127 * 92 ^ ((36-AWG)/39)
-
-    Reference: http://www.reuk.co.uk/AWG-to-Square-mm-Wire-Size-Converter.htm
+    Integer gauges (scalar or array) index a table precomputed at
+    import time; fractional gauges use the closed form.
     """
-    diameter_mm = 0.127 * (92 ** ((36 - awg) / 39))
-    diameter_m  = diameter_mm / 1000
-    return Radius(diameter_m / 2)
+    if _table_gauges(awg):
+        return _AWG_RADIUS_TABLE[awg]
+    return _awg_radius_formula(awg)
 
 def awg_area(awg:WireGauge) -> Area:
     """
     :param awg: AWG number
     :return:    Wire cross sectional area in m^2
     """
-    return Area(math.pi * (awg_radius(awg) ** 2))
+    if _table_gauges(awg):
+        return _AWG_AREA_TABLE[awg]
+    radius = awg_radius(awg)
+    return math.pi * radius * radius
+
+def copper_resistivity(temp:Temperature=_REFERENCE_TEMP) -> float:
+    """
+    Copper resistivity at the given temperature [ohm . m]
+
+    Callers that already hold the wire cross section can divide by it
+    directly instead of going through awg_resistance_per_length, which
+    would recompute the area.
+    """
+    return _COPPER_RESISTIVITY + _COPPER_RHO_ALPHA * (temp - _REFERENCE_TEMP)
+
+def _awg_rpl_formula(awg:WireGauge, temp:Temperature) -> ResistancePerLength:
+    """Closed form resistance per unit length for any gauge and temperature"""
+    return copper_resistivity(temp) / awg_area(awg)
 
 def awg_resistance_per_length(
     awg:WireGauge,
-    temp:Temperature=Temperature(293)) -> ResistancePerLength:
+    temp:Temperature=_REFERENCE_TEMP) -> ResistancePerLength:
     """
     :param awg:       Wire AWG
     :param temp:      Temperature [K]
     :return:          Resistance per unit length for copper at given temperature [Ohm/m]
-    """
-    # Reference: http://www.endmemo.com/physics/resistt.php
-    reference_temp      = 293      # 20C
-    resistivity         = 1.68e-8  # [ohm . m]
-    alpha               = 0.0039   # thermal coefficient [1/K]
-    delta_t             = temp - reference_temp
-    resistivity_at_temp = resistivity * (1 + alpha * delta_t)
-    area                = awg_area(awg)
 
-    return ResistancePerLength(resistivity_at_temp / area)
+    Integer gauges at the reference temperature come from a table
+    precomputed at import time; other inputs use the closed form.
+    """
+    if temp == _REFERENCE_TEMP and _table_gauges(awg):
+        return _AWG_RPL_TABLE[awg]
+    return _awg_rpl_formula(awg, temp)
+
+# per-gauge properties precomputed once at import as parallel contiguous
+# arrays indexed by integer AWG; the reciprocal areas turn the resistance
+# division into a multiplication
+_AWG_RADIUS_TABLE: np.ndarray = \
+    _awg_radius_formula(np.arange(_MAX_AWG + 1))  # type: ignore[arg-type,assignment]
+_AWG_AREA_TABLE     = math.pi * _AWG_RADIUS_TABLE * _AWG_RADIUS_TABLE
+_AWG_INV_AREA_TABLE = 1.0 / _AWG_AREA_TABLE
+_AWG_RPL_TABLE      = copper_resistivity() * _AWG_INV_AREA_TABLE
 
 def awg_resistance(
     awg:WireGauge,
     length:Length=Length(1),
-    temp:Temperature=Temperature(293)) -> Resistance:
+    temp:Temperature=_REFERENCE_TEMP) -> Resistance:
     """Wire resistance for given length"""
-    return Resistance(awg_resistance_per_length(awg, temp) * length)
+    return awg_resistance_per_length(awg, temp) * length
 
 def awg_current_limit(awg:WireGauge) -> Current:
     """
@@ -85,33 +145,4 @@ def awg_current_limit(awg:WireGauge) -> Current:
     Allow 2.5 amps per mm^2
     """
     area_mm_2 = awg_area(awg) * 1e6
-    return Current(area_mm_2 * 3)
-
-class TestWires(TestCase):
-    """Unit tests"""
-    def test_radius(self) -> None:
-        """Test awg_radius"""
-        self.assertAlmostEqual(awg_radius(WireGauge(0)),  8.25246 / 1000 / 2, places=5)
-        self.assertAlmostEqual(awg_radius(WireGauge(10)), 2.58826 / 1000 / 2, places=5)
-        self.assertAlmostEqual(awg_radius(WireGauge(20)), 0.81280 / 1000 / 2, places=5)
-        self.assertAlmostEqual(awg_radius(WireGauge(30)), 0.25400 / 1000 / 2, places=5)
-
-    def test_area(self) -> None:
-        """Test awg_area"""
-        self.assertAlmostEqual(awg_area(WireGauge(1)),  42.46  / 1e6, places=5)
-        self.assertAlmostEqual(awg_area(WireGauge(11)), 4.17   / 1e6, places=5)
-        self.assertAlmostEqual(awg_area(WireGauge(21)), 0.412  / 1e6, places=5)
-        self.assertAlmostEqual(awg_area(WireGauge(31)), 0.0401 / 1e6, places=5)
-
-    def test_resistance(self) -> None:
-        """Test awg_resistance"""
-        self.assertAlmostEqual(awg_resistance(WireGauge(2),  Length(1000)), 0.49954,   places=4)
-        self.assertAlmostEqual(awg_resistance(WireGauge(12), Length(1000)), 5.07741,   places=4)
-        self.assertAlmostEqual(awg_resistance(WireGauge(22), Length(1000)), 51.607521, places=4)
-        self.assertAlmostEqual(awg_resistance(WireGauge(32), Length(1000)), 524.54612, places=4)
-
-    def test_current_limit(self) -> None:
-        """Test awg_current_limit"""
-        self.assertAlmostEqual(awg_current_limit(WireGauge(2)),  100.89, places=2)
-        self.assertAlmostEqual(awg_current_limit(WireGauge(10)),  15.78, places=2)
-        self.assertAlmostEqual(awg_current_limit(WireGauge(20)),  1.55,  places=2)
+    return area_mm_2 * 3
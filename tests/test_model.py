@@ -0,0 +1,133 @@
+# Solenoid
+# Copyright (C) 2022 Jung Ko <kojung@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of  MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Unit tests for solenoid.model
+"""
+
+from unittest import TestCase
+
+import numpy as np
+
+from solenoid.model import (
+    average_radius,
+    force,
+    material_decay_factor,
+    objective_force,
+    power,
+    resistance,
+)
+from solenoid.units import (
+    Length,
+    PackingDensity,
+    Radius,
+    RelativePermeability,
+    Turns,
+    Voltage,
+    WireGauge,
+)
+
+class TestModel(TestCase):
+    """Unit tests"""
+    def test_average_radius(self) -> None:
+        """Test awg_radius"""
+        # Figure 6a of [1]
+        d   = PackingDensity(0.25) # reverse-engineered value
+        l   = Length(27 / 1000)    # 27mm
+        r_o = Radius(2.3 / 1000)   # 2.3mm
+        awg = WireGauge(30)
+        N   = Turns(572)
+        r_a = average_radius(awg, r_o, l, N, d)
+        self.assertAlmostEqual(r_a, 4.4 / 1000, delta=0.0001)
+
+    def test_resistance(self) -> None:
+        """Test awg_radius"""
+        # Figure 6a of [1]
+        d   = PackingDensity(0.25) # reverse-engineered value
+        l   = Length(27 / 1000)    # 27mm
+        r_o = Radius(2.3 / 1000)   # 2.3mm
+        awg = WireGauge(30)
+        N   = Turns(572)
+        self.assertAlmostEqual(resistance(awg, r_o, l, N, d), 5.3, delta=0.05)
+
+    def test_force(self) -> None:
+        """Test solenoid force"""
+        # Figure 6a of [1]
+        v    = Voltage(4.3)               # reverse-engineered value
+        mu_r = RelativePermeability(375)  # from Paul's email
+        d    = PackingDensity(0.25)       # reverse-engineered value
+        l    = Length(27 / 1000)          # 27mm
+        r_o  = Radius(2.3 / 1000)         # 2.3mm
+        awg  = WireGauge(30)
+        N    = Turns(572)
+        self.assertAlmostEqual(force(v, mu_r, awg, r_o, l, N, d), 6.8, delta=0.1)
+
+    def test_power(self) -> None:
+        """Test solenoid power"""
+        # Figure 6a of [1]
+        v    = Voltage(4.3)               # reverse-engineered value
+        d    = PackingDensity(0.25)       # reverse-engineered value
+        l    = Length(27 / 1000)          # 27mm
+        r_o  = Radius(2.3 / 1000)         # 2.3mm
+        awg  = WireGauge(30)
+        N    = Turns(572)
+        self.assertAlmostEqual(power(v, awg, r_o, l, N, d), 4, delta=0.51)
+
+    def test_array_arguments(self) -> None:
+        """Model functions evaluate numpy arrays elementwise"""
+        mu_r = RelativePermeability(375)
+        d    = PackingDensity(0.25)
+        l    = Length(27 / 1000)
+        r_o  = Radius(2.3 / 1000)
+        awg  = WireGauge(30)
+        N    = Turns(572)
+        voltages = np.linspace(1, 10, 5)
+        forces = np.asarray(force(voltages, mu_r, awg, r_o, l, N, d))  # type: ignore[arg-type]
+        self.assertEqual(forces.shape, voltages.shape)
+        for volt, newton in zip(voltages, forces):
+            self.assertAlmostEqual(newton, force(Voltage(volt), mu_r, awg, r_o, l, N, d))
+
+    def test_material_decay_factor(self) -> None:
+        """Catalog lookup matches the closed form"""
+        self.assertAlmostEqual(material_decay_factor("soft_iron"), np.log(5000))
+
+    def test_objective_force(self) -> None:
+        """Row-wise objective matches scalar force calls"""
+        params = np.array([
+            # v,   mu_r, awg, r_o,        l,        N,   d
+            [4.3,  375,  30,  2.3 / 1000, 27 / 1000, 572, 0.25],
+            [6.0,  375,  28,  3.0 / 1000, 30 / 1000, 600, 0.30],
+        ])
+        forces = objective_force(params)
+        self.assertEqual(forces.shape, (2,))
+        for row, newton in zip(params, forces):
+            self.assertAlmostEqual(newton, force(*row))
+
+    def test_broadcast_grid(self) -> None:
+        """Array arguments broadcast into a multi-dimensional sweep grid"""
+        mu_r = RelativePermeability(375)
+        d    = PackingDensity(0.25)
+        l    = Length(27 / 1000)
+        r_o  = Radius(2.3 / 1000)
+        awg  = WireGauge(30)
+        voltages = np.linspace(1, 10, 3).reshape(3, 1)
+        turns    = np.linspace(100, 1000, 4)
+        forces = np.asarray(force(voltages, mu_r, awg, r_o, l, turns, d))  # type: ignore[arg-type]
+        self.assertEqual(forces.shape, (3, 4))
+        for i in range(3):
+            for j in range(4):
+                self.assertAlmostEqual(
+                    forces[i, j],
+                    force(Voltage(voltages[i, 0]), mu_r, awg, r_o, l, Turns(turns[j]), d))
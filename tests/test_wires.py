@@ -0,0 +1,60 @@
+# Solenoid
+# Copyright (C) 2022 Jung Ko <kojung@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of  MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Unit tests for solenoid.wires
+"""
+
+from unittest import TestCase
+
+from solenoid.wires import (
+    awg_area,
+    awg_current_limit,
+    awg_radius,
+    awg_resistance,
+)
+from solenoid.units import (
+    Length,
+    WireGauge,
+)
+
+class TestWires(TestCase):
+    """Unit tests"""
+    def test_radius(self) -> None:
+        """Test awg_radius"""
+        self.assertAlmostEqual(awg_radius(WireGauge(0)),  8.25246 / 1000 / 2, places=5)
+        self.assertAlmostEqual(awg_radius(WireGauge(10)), 2.58826 / 1000 / 2, places=5)
+        self.assertAlmostEqual(awg_radius(WireGauge(20)), 0.81280 / 1000 / 2, places=5)
+        self.assertAlmostEqual(awg_radius(WireGauge(30)), 0.25400 / 1000 / 2, places=5)
+
+    def test_area(self) -> None:
+        """Test awg_area"""
+        self.assertAlmostEqual(awg_area(WireGauge(1)),  42.46  / 1e6, places=5)
+        self.assertAlmostEqual(awg_area(WireGauge(11)), 4.17   / 1e6, places=5)
+        self.assertAlmostEqual(awg_area(WireGauge(21)), 0.412  / 1e6, places=5)
+        self.assertAlmostEqual(awg_area(WireGauge(31)), 0.0401 / 1e6, places=5)
+
+    def test_resistance(self) -> None:
+        """Test awg_resistance"""
+        self.assertAlmostEqual(awg_resistance(WireGauge(2),  Length(1000)), 0.49954,   places=4)
+        self.assertAlmostEqual(awg_resistance(WireGauge(12), Length(1000)), 5.07741,   places=4)
+        self.assertAlmostEqual(awg_resistance(WireGauge(22), Length(1000)), 51.607521, places=4)
+        self.assertAlmostEqual(awg_resistance(WireGauge(32), Length(1000)), 524.54612, places=4)
+
+    def test_current_limit(self) -> None:
+        """Test awg_current_limit"""
+        self.assertAlmostEqual(awg_current_limit(WireGauge(2)),  100.89, places=2)
+        self.assertAlmostEqual(awg_current_limit(WireGauge(10)),  15.78, places=2)
+        self.assertAlmostEqual(awg_current_limit(WireGauge(20)),  1.55,  places=2)
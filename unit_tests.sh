@@ -1,3 +1,3 @@
 #!/bin/bash
 
-python -m unittest src/solenoid/*.py
+python -m unittest src/solenoid/*.py tests/*.py